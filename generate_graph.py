@@ -13,14 +13,71 @@ import argparse
 import html
 import json
 import re
-import xml.etree.ElementTree as ET
+import string
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+# lxml parses through libxml2 and is noticeably faster on large feeds; the
+# stdlib parser is a drop-in fallback for the subset of the API used here.
+try:
+    from lxml import etree as ET
+    _HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _HAVE_LXML = False
+
+# orjson encodes the embedded graph data several times faster than the
+# stdlib; both produce the same compact JSON with non-ASCII text kept as is.
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+# Trailing ' - Domain' suffix: a space-padded dash-like separator followed by
+# a domain that contains no dash-like chars itself.
+_DOMAIN_SUFFIX = re.compile(r"\s+[\-–—]\s+([^\-–—]+)$")
+_APOS = re.compile(r"[''']")
+_NONALNUM = re.compile(r"[^a-z0-9]+")
+
+# ASCII slug table for str.translate: drop apostrophes, keep [a-z0-9], and
+# turn everything else into '-' (runs are collapsed afterwards).
+_SLUG_CHARS = frozenset(string.ascii_lowercase + string.digits)
+_SLUG_TABLE = str.maketrans({
+    chr(c): "" if chr(c) == "'" else chr(c) if chr(c) in _SLUG_CHARS else "-"
+    for c in range(128)
+})
+
+# The exact pubDate shape Substack emits, e.g. "Mon, 09 Dec 2024 18:25:23 GMT".
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+           "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+_RSS_DATE = re.compile(
+    r"(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun), (\d{2}) (" + "|".join(_MONTHS) + r") "
+    r"(\d{4}) (\d{2}):(\d{2}):(\d{2}) GMT",
+    re.ASCII,
+)
+
 
 def parse_date(date_str: str) -> str:
     """Convert RSS date format to readable format."""
+    # Fast path: match the fixed Substack format directly and let
+    # datetime() range-check them, skipping strptime's locale machinery.
+    m = _RSS_DATE.fullmatch(date_str)
+    if m:
+        day, month, year, hh, mm, ss = m.groups()
+        try:
+            datetime(int(year), _MONTHS.index(month) + 1, int(day),
+                     int(hh), int(mm), int(ss))
+        except ValueError:
+            pass
+        else:
+            return f"{month} {day}, {year}"
+
     try:
         # RSS format: "Mon, 09 Dec 2024 18:25:23 GMT"
         dt = datetime.strptime(date_str, "%a, %d %b %Y %H:%M:%S %Z")
@@ -49,9 +106,8 @@ def split_title(title: str) -> tuple[str, str]:
     s = title.strip()
     domain = "Misc"
 
-    # Peel off a trailing ' - Domain' if present (last occurrence, no
-    # dash-like chars inside the domain itself).
-    m = re.search(r"\s+[\-–—]\s+([^\-–—]+)$", s)
+    # Peel off a trailing ' - Domain' if present (last occurrence).
+    m = _DOMAIN_SUFFIX.search(s)
     if m:
         domain = m.group(1).strip()
         s = s[:m.start()].strip()
@@ -66,20 +122,28 @@ def split_title(title: str) -> tuple[str, str]:
 def slugify(name: str) -> str:
     """Convert a name to a URL-friendly slug."""
     s = name.lower().strip()
-    s = re.sub(r"[''']", "", s)
-    s = re.sub(r"[^a-z0-9]+", "-", s).strip("-")
+    if s.isascii():
+        # Common case: a single C-level translate pass, no regex engine.
+        s = "-".join(filter(None, s.translate(_SLUG_TABLE).split("-")))
+    else:
+        s = _APOS.sub("", s)
+        s = _NONALNUM.sub("-", s).strip("-")
     return s or "untitled"
 
 
 def parse_rss(rss_path: str) -> list[dict]:
-    """Parse RSS feed and extract post data."""
-    tree = ET.parse(rss_path)
-    root = tree.getroot()
-
-    items = root.findall(".//item")
+    """
+    Parse RSS feed and extract post data.
 
+    The feed is streamed with iterparse and each <item> is cleared once it
+    has been read, so peak memory tracks a single item rather than the
+    whole document.
+    """
     posts = []
-    for item in items:
+    for _, item in ET.iterparse(rss_path, events=("end",)):
+        if item.tag != "item":
+            continue
+
         title = item.findtext("title") or ""
         link = item.findtext("link") or ""
         pub_date = item.findtext("pubDate") or ""
@@ -101,17 +165,25 @@ def parse_rss(rss_path: str) -> list[dict]:
             "pubDate": parse_date(pub_date),
             "description": description
         })
+        item.clear()
+        if _HAVE_LXML:
+            # lxml keeps cleared items attached to <channel>; drop the
+            # already-processed siblings so they can be freed as well.
+            while item.getprevious() is not None:
+                del item.getparent()[0]
 
     return posts
 
 
 def load_crosslinks(crosslinks_path: Optional[str]) -> list[dict]:
     """Load manual cross-links from JSON file."""
-    if not crosslinks_path or not Path(crosslinks_path).exists():
+    if not crosslinks_path:
         return []
 
-    with open(crosslinks_path, "r") as f:
-        data = json.load(f)
+    try:
+        data = json.loads(Path(crosslinks_path).read_bytes())
+    except FileNotFoundError:
+        return []
 
     return data.get("crosslinks", [])
 
@@ -125,47 +197,107 @@ def generate_auto_crosslinks(posts: list[dict]) -> list[dict]:
 
     # Define some logical cross-domain relationships
     # These are common mental model connections
-    domain_bridges = {
-        ("Economics", "Psychology"): True,
-        ("Mathematics", "Economics"): True,
-        ("Mathematics", "Logic"): True,
-        ("Psychology", "Logic"): True,
-    }
+    domain_bridges = (
+        ("Economics", "Psychology"),
+        ("Mathematics", "Economics"),
+        ("Mathematics", "Logic"),
+        ("Psychology", "Logic"),
+    )
 
-    # Group posts by domain
-    by_domain = {}
+    # Only the first post of each domain is ever linked, so keep just that
+    first_by_domain = {}
     for p in posts:
-        by_domain.setdefault(p["domain"], []).append(p)
-
-    # Create cross-links between related domains (one link per domain pair)
-    domains = list(by_domain.keys())
-    for i, d1 in enumerate(domains):
-        for d2 in domains[i+1:]:
-            pair = tuple(sorted([d1, d2]))
-            if pair in domain_bridges or (pair[1], pair[0]) in domain_bridges:
-                # Link first post from each domain
-                if by_domain[d1] and by_domain[d2]:
-                    crosslinks.append({
-                        "source": by_domain[d1][0]["id"],
-                        "target": by_domain[d2][0]["id"]
-                    })
+        first_by_domain.setdefault(p["domain"], p)
+
+    # Create one cross-link per bridge whose domains both have posts
+    for d1, d2 in domain_bridges:
+        if d1 in first_by_domain and d2 in first_by_domain:
+            crosslinks.append({
+                "source": first_by_domain[d1]["id"],
+                "target": first_by_domain[d2]["id"]
+            })
 
     return crosslinks
 
 
-def generate_html(posts: list[dict], crosslinks: list[dict]) -> str:
-    """Generate the complete HTML visualization."""
+def build_adjacency(nodes: list[dict], links: list[dict]) -> dict[str, list[str]]:
+    """
+    Map every graph node id to the ids it is linked to, itself included.
+
+    Lets the browser look up hover neighbourhoods directly instead of
+    scanning every link for every node.
+    """
+    adjacency = {n["id"]: [n["id"]] for n in nodes}
+    for l in links:
+        source, target = l["source"], l["target"]
+        if source in adjacency:
+            adjacency[source].append(target)
+        if target in adjacency:
+            adjacency[target].append(source)
+
+    return adjacency
+
 
-    # Convert posts to JavaScript
-    posts_json = json.dumps(posts, indent=12, ensure_ascii=False)
+def list_domains(posts: list[dict]) -> list[str]:
+    """Return the distinct post domains in first-seen order."""
+    return list(dict.fromkeys(p["domain"] for p in posts))
 
-    # Build crosslinks JavaScript
-    crosslinks_js = ",\n            ".join([
-        f'{{ source: "{cl["source"]}", target: "{cl["target"]}", type: "cross-link" }}'
+
+def build_graph(posts: list[dict], crosslinks: list[dict], domains: list[str]) -> dict:
+    """
+    Build the domains, nodes, links and adjacency the page renders.
+
+    One hub node per domain plus one node per post; every post links to
+    its hub, and cross-links connect posts directly.
+    """
+    domain_counts = Counter(p["domain"] for p in posts)
+
+    nodes = [
+        {
+            "id": f"hub-{d}",
+            "label": d,
+            "type": "hub",
+            "domain": d,
+            "count": domain_counts[d],
+            "radius": 22
+        }
+        for d in domains
+    ]
+    nodes += [
+        {
+            "id": p["id"],
+            "label": p["title"],
+            "type": "post",
+            "domain": p["domain"],
+            "link": p["link"],
+            "pubDate": p["pubDate"],
+            "description": p["description"],
+            "radius": 14
+        }
+        for p in posts
+    ]
+
+    links = [
+        {"source": f"hub-{p['domain']}", "target": p["id"], "type": "hub-link"}
+        for p in posts
+    ]
+    # Cross-links (manually curated or auto-generated)
+    links += [
+        {"source": cl["source"], "target": cl["target"], "type": "cross-link"}
         for cl in crosslinks
-    ])
+    ]
 
-    html_template = '''<!DOCTYPE html>
+    return {
+        "domains": domains,
+        "nodes": nodes,
+        "links": links,
+        "adjacency": build_adjacency(nodes, links)
+    }
+
+
+# Static page fragments for generate_html; the generated data is spliced in
+# between them.
+_HTML_PRE = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -507,8 +639,11 @@ def generate_html(posts: list[dict], crosslinks: list[dict]) -> str:
     </div>
 
     <script>
-        // Blog post data (auto-generated from RSS feed)
-        const posts = ''' + posts_json + ''';
+        // Graph data (auto-generated from RSS feed)
+        const graph = '''
+
+_HTML_POST = ''';
+        const { domains, nodes, links } = graph;
 
         // Domain color palette (auto-assigned)
         const colorPalette = [
@@ -522,7 +657,6 @@ def generate_html(posts: list[dict], crosslinks: list[dict]) -> str:
             "#C084FC", // violet
         ];
 
-        const domains = [...new Set(posts.map(p => p.domain))];
         const domainColors = { "Hub": "#6366F1" };
         domains.forEach((d, i) => {
             domainColors[d] = colorPalette[i % colorPalette.length];
@@ -543,38 +677,6 @@ def generate_html(posts: list[dict], crosslinks: list[dict]) -> str:
             `).join('')}
         `;
 
-        // Create nodes array
-        const nodes = [
-            ...domains.map(d => ({
-                id: `hub-${d}`,
-                label: d,
-                type: 'hub',
-                domain: d,
-                radius: 22
-            })),
-            ...posts.map(p => ({
-                id: p.id,
-                label: p.title,
-                type: 'post',
-                domain: p.domain,
-                link: p.link,
-                pubDate: p.pubDate,
-                description: p.description,
-                radius: 14
-            }))
-        ];
-
-        // Create links array
-        const links = [
-            ...posts.map(p => ({
-                source: `hub-${p.domain}`,
-                target: p.id,
-                type: 'hub-link'
-            })),
-            // Cross-links (manually curated or auto-generated)
-            ''' + crosslinks_js + '''
-        ];
-
         // SVG setup
         const svg = d3.select('#graph-canvas');
         const container = document.getElementById('container');
@@ -679,26 +781,24 @@ def generate_html(posts: list[dict], crosslinks: list[dict]) -> str:
         const tooltip = document.getElementById('tooltip');
         let tooltipX = 0, tooltipY = 0;
         let tooltipVisible = false;
-
-        function updateTooltipPosition() {
-            if (tooltipVisible) {
-                tooltip.style.transform = `translate(${tooltipX}px, ${tooltipY}px)`;
-            }
-            requestAnimationFrame(updateTooltipPosition);
+        let tooltipFrame = null;
+
+        // Coalesce pointer moves into at most one transform write per frame,
+        // and only schedule frames while the pointer is actually moving.
+        function scheduleTooltipPosition() {
+            if (tooltipFrame !== null) return;
+            tooltipFrame = requestAnimationFrame(() => {
+                tooltipFrame = null;
+                if (tooltipVisible) {
+                    tooltip.style.transform = `translate(${tooltipX}px, ${tooltipY}px)`;
+                }
+            });
         }
-        requestAnimationFrame(updateTooltipPosition);
 
-        const connectedNodesMap = new Map();
-        nodes.forEach(n => {
-            const connected = new Set([n.id]);
-            links.forEach(l => {
-                const sourceId = typeof l.source === 'object' ? l.source.id : l.source;
-                const targetId = typeof l.target === 'object' ? l.target.id : l.target;
-                if (sourceId === n.id) connected.add(targetId);
-                if (targetId === n.id) connected.add(sourceId);
-            });
-            connectedNodesMap.set(n.id, connected);
-        });
+        // Node id -> ids it links to, itself included (precomputed in Python)
+        const connectedNodesMap = new Map(
+            Object.entries(graph.adjacency).map(([id, ids]) => [id, new Set(ids)])
+        );
 
         node.on('mouseenter', function(event, d) {
             d3.select(this).select('.node-circle')
@@ -730,7 +830,7 @@ def generate_html(posts: list[dict], crosslinks: list[dict]) -> str:
                     <div class="tooltip-hint">Click to read →</div>
                 `;
             } else {
-                const count = posts.filter(p => p.domain === d.domain).length;
+                const count = d.count;
                 tooltip.innerHTML = `
                     <div class="tooltip-title">${d.label}</div>
                     <div class="tooltip-description">${count} mental model${count > 1 ? 's' : ''}</div>
@@ -740,6 +840,7 @@ def generate_html(posts: list[dict], crosslinks: list[dict]) -> str:
             tooltipX = event.pageX + 15;
             tooltipY = event.pageY + 15;
             tooltipVisible = true;
+            scheduleTooltipPosition();
             tooltip.classList.add('visible');
         });
 
@@ -757,6 +858,7 @@ def generate_html(posts: list[dict], crosslinks: list[dict]) -> str:
 
             tooltipX = x;
             tooltipY = y;
+            scheduleTooltipPosition();
         });
 
         node.on('mouseleave', function(event, d) {
@@ -830,7 +932,34 @@ def generate_html(posts: list[dict], crosslinks: list[dict]) -> str:
 </body>
 </html>'''
 
-    return html_template
+
+def html_fragments(
+    posts: list[dict],
+    crosslinks: list[dict],
+    domains: Optional[list[str]] = None,
+) -> list[str]:
+    """
+    Build the HTML visualization as a list of fragments.
+
+    Concatenating the fragments gives the full page; callers writing to a
+    file can stream them with writelines() instead of building one string.
+    Pass `domains` (as from list_domains) if it has already been computed.
+    """
+    if domains is None:
+        domains = list_domains(posts)
+
+    graph_json = _dumps(build_graph(posts, crosslinks, domains))
+
+    return [_HTML_PRE, graph_json, _HTML_POST]
+
+
+def generate_html(
+    posts: list[dict],
+    crosslinks: list[dict],
+    domains: Optional[list[str]] = None,
+) -> str:
+    """Generate the complete HTML visualization."""
+    return "".join(html_fragments(posts, crosslinks, domains))
 
 
 def main():
@@ -870,7 +999,8 @@ def main():
     # Parse RSS feed
     print(f"📖 Parsing RSS feed: {args.rss}")
     posts = parse_rss(args.rss)
-    print(f"   Found {len(posts)} posts across {len(set(p['domain'] for p in posts))} domains")
+    domains = list_domains(posts)
+    print(f"   Found {len(posts)} posts across {len(domains)} domains")
 
     # Load or generate cross-links
     crosslinks = load_crosslinks(args.crosslinks)
@@ -884,11 +1014,12 @@ def main():
 
     # Generate HTML
     print(f"🎨 Generating visualization...")
-    html_content = generate_html(posts, crosslinks)
+    fragments = html_fragments(posts, crosslinks, domains)
 
     # Write output
     output_path = Path(args.output)
-    output_path.write_text(html_content, encoding="utf-8")
+    with output_path.open("w", encoding="utf-8", buffering=1 << 20) as f:
+        f.writelines(fragments)
     print(f"✅ Wrote {output_path}")
     print(f"\n🌐 Open in browser: file://{output_path.absolute()}")
 